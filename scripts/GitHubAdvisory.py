@@ -7,10 +7,12 @@ Requires: GITHUB_TOKEN env var (read:security_advisories scope)
 Schedule: Run via .github/workflows/github-advisory.yml
 """
 
-import json
 import os
 import time
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from urllib.parse import urlparse
 
@@ -24,12 +26,34 @@ HEADERS = {
     'User-Agent': 'DevDigest-Bot/1.0',
 }
 
+# GraphQL queries are read-only, so POST is safe to retry here
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset({'POST'}),
+    ),
+))
+SESSION.headers.update(HEADERS)
+
 # Fetch N advisories per run (stay well within rate limits)
 FETCH_PER_RUN = 10
 
+# Advisories per GraphQL page (API maximum) — pages are cursor-chained, so
+# fewer, larger pages mean fewer sequential round trips
+PAGE_SIZE = 100
+
+# Only look this many pages back from the newest advisory, so run time stays
+# bounded however large the database grows
+MAX_PAGES = 5
+
 QUERY = """
-query($cursor: String) {
-  securityAdvisories(first: 20, after: $cursor, orderBy: {field: PUBLISHED_AT, direction: DESC}) {
+query($first: Int!, $cursor: String) {
+  securityAdvisories(first: $first, after: $cursor, orderBy: {field: PUBLISHED_AT, direction: DESC}) {
     pageInfo { hasNextPage endCursor }
     nodes {
       ghsaId
@@ -53,23 +77,28 @@ query($cursor: String) {
 
 
 def load_existing():
-    if not os.path.exists(OUTPUT_FILE):
-        return [], set()
     try:
-        with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        existing_ids = {row.get('id') for row in data if row.get('id')}
+        with open(OUTPUT_FILE, 'rb') as f:
+            data = orjson.loads(f.read())
+        existing_ids = {row_id for row in data if (row_id := row.get('id'))}
         return data, existing_ids
+    except FileNotFoundError:
+        return [], set()
     except Exception as e:
         print(f'Warning: could not read {OUTPUT_FILE}: {e}')
         return [], set()
 
 
+def _json(response):
+    """Parse a response body with orjson, skipping the text decode step."""
+    return orjson.loads(response.content)
+
+
 def fetch_advisories(cursor=None):
-    payload = {'query': QUERY, 'variables': {'cursor': cursor}}
-    resp = requests.post(GRAPHQL_URL, headers=HEADERS, json=payload, timeout=20)
+    payload = {'query': QUERY, 'variables': {'first': PAGE_SIZE, 'cursor': cursor}}
+    resp = SESSION.post(GRAPHQL_URL, json=payload, timeout=20)
     resp.raise_for_status()
-    data = resp.json()
+    data = _json(resp)
     if 'errors' in data:
         raise RuntimeError(f"GraphQL errors: {data['errors']}")
     return data['data']['securityAdvisories']
@@ -162,8 +191,9 @@ def advisory_to_rows(node):
 
 def save(all_rows):
     os.makedirs(os.path.dirname(OUTPUT_FILE), exist_ok=True)
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(all_rows, f, indent=2, ensure_ascii=False)
+    payload = orjson.dumps(all_rows, option=orjson.OPT_INDENT_2)
+    with open(OUTPUT_FILE, 'wb') as f:
+        f.write(payload)
 
 
 def main():
@@ -177,9 +207,11 @@ def main():
     new_rows = []
     cursor = None
     fetched = 0
+    pages = 0
 
-    while fetched < FETCH_PER_RUN:
+    while fetched < FETCH_PER_RUN and pages < MAX_PAGES:
         result = fetch_advisories(cursor)
+        pages += 1
         nodes = result['nodes']
 
         for node in nodes:
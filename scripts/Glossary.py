@@ -1,10 +1,10 @@
-import json
-import requests
-import os
+import orjson
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import random
 import re
 from datetime import datetime
-import urllib.parse
 import time
 
 # --- Configuration ---
@@ -27,24 +27,48 @@ OUTPUT_FILE = 'public/CS_Glossary.json'
 API_URL = "https://en.wikipedia.org/w/api.php"
 HEADERS = {'User-Agent': 'DevDigest-Bot/1.0 (jeffin.issac2203@gmail.com)'}
 
+# Wikipedia answers with Cache-Control: max-age=0, so expiry is forced here
+# rather than taken from response headers. The workflow persists this file.
+CACHE_FILE = 'wiki_cache.sqlite'
+CACHE_EXPIRY = 24 * 60 * 60
 
-def load_existing_topics():
-    """Load topics already in the JSON to prevent duplicates."""
-    existing_topics = set()
-    if os.path.exists(OUTPUT_FILE):
-        try:
-            with open(OUTPUT_FILE, 'r', encoding='UTF8') as f:
-                entries = json.load(f)
-                for entry in entries:
-                    if entry.get('topic'):
-                        existing_topics.add(entry['topic'].lower().strip())
-        except Exception as e:
-            print(f"Error reading JSON: {e}")
-    return existing_topics
+# Titles sent per extracts query (the API caps intro extracts at 20)
+CANDIDATES_PER_FETCH = 5
 
+# One keep-alive, disk-cached session for every Wikipedia call in a run
+SESSION = requests_cache.CachedSession(CACHE_FILE, backend='sqlite', expire_after=CACHE_EXPIRY)
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+))
+SESSION.headers.update(HEADERS)
 
-def get_random_page_from_category(category_name):
-    """Fetches a list of pages from a Wikipedia category and returns a random one."""
+
+def load_entries():
+    """Load the existing glossary entries from the JSON file."""
+    try:
+        with open(OUTPUT_FILE, 'rb') as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Warning: could not read existing JSON, starting fresh: {e}")
+    return []
+
+
+def load_existing_topics(entries):
+    """Collect topics already in the glossary to prevent duplicates."""
+    return {topic.lower().strip() for entry in entries if (topic := entry.get('topic'))}
+
+
+def _json(response):
+    """Parse a response body with orjson, skipping the text decode step."""
+    return orjson.loads(response.content)
+
+
+def get_candidate_pages_from_category(category_name, used_topics, count=CANDIDATES_PER_FETCH):
+    """Fetches a list of pages from a Wikipedia category and returns a random sample of unused ones."""
     params = {
         'action': 'query',
         'list': 'categorymembers',
@@ -56,21 +80,20 @@ def get_random_page_from_category(category_name):
         'cmdir': 'desc'
     }
     try:
-        response = requests.get(API_URL, params=params, headers=HEADERS, timeout=15)
+        response = SESSION.get(API_URL, params=params, timeout=15)
         response.raise_for_status()
-        data = response.json()
+        data = _json(response)
         pages = data.get('query', {}).get('categorymembers', [])
-        if not pages:
-            return None
-        valid_pages = [
-            p for p in pages
+        valid_titles = [
+            p['title'] for p in pages
             if not p['title'].startswith('List of')
             and '(disambiguation)' not in p['title'].lower()
+            and p['title'].lower().strip() not in used_topics
         ]
-        return random.choice(valid_pages)['title'] if valid_pages else None
+        return random.sample(valid_titles, min(count, len(valid_titles)))
     except Exception as e:
         print(f"Error fetching category {category_name}: {e}")
-        return None
+        return []
 
 
 def clean_definition(text):
@@ -82,33 +105,48 @@ def clean_definition(text):
     return text.strip()
 
 
-def get_wikipedia_definition(topic):
-    """Fetches and cleans the summary definition for a topic from Wikipedia."""
-    print(f"Fetching definition for: {topic}...")
-    encoded_topic = urllib.parse.quote(topic)
-    url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{encoded_topic}"
+def get_wikipedia_definitions(topics):
+    """Fetches and cleans the intro definitions for several topics in one Wikipedia API call."""
+    print(f"Fetching definitions for: {', '.join(topics)}...")
+    params = {
+        'action': 'query',
+        'prop': 'extracts|info|pageprops',
+        'titles': '|'.join(topics),
+        'exintro': '1',
+        'explaintext': '1',
+        'exlimit': 'max',
+        'inprop': 'url',
+        'ppprop': 'disambiguation',
+        'redirects': '1',
+        'format': 'json'
+    }
     try:
-        response = requests.get(url, headers=HEADERS, timeout=10)
-        if response.status_code == 404:
-            return None
+        response = SESSION.get(API_URL, params=params, timeout=15)
         response.raise_for_status()
-        data = response.json()
-
-        title = data.get('title', topic)
-        definition = clean_definition(data.get('extract', ''))
-        wiki_url = data.get('content_urls', {}).get('desktop', {}).get('page', '')
-
-        if not definition or data.get('type') == 'disambiguation':
-            return None
-
-        return {'topic': title, 'definition': definition, 'url': wiki_url}
+        pages = _json(response).get('query', {}).get('pages', {})
     except Exception as e:
         print(f"Error fetching Wikipedia data: {e}")
-        return None
+        return {}
 
+    definitions = {}
+    for page in pages.values():
+        if 'missing' in page or 'disambiguation' in page.get('pageprops', {}):
+            continue
+        # The intro can run to several paragraphs; keep only the lead one
+        paragraphs = [p for p in page.get('extract', '').split('\n') if p.strip()]
+        definition = clean_definition(paragraphs[0]) if paragraphs else ''
+        if not definition:
+            continue
+        definitions[page['title']] = {
+            'topic': page['title'],
+            'definition': definition,
+            'url': page.get('fullurl', '')
+        }
+    return definitions
 
-def save_entry(data, label):
-    """Saves the retrieved data to the JSON file."""
+
+def save_entry(entries, data, label):
+    """Appends the retrieved data to the loaded entries and saves the JSON file."""
     current_date = datetime.now().strftime('%Y-%m-%d')
     new_entry = {
         'date_added': current_date,
@@ -117,51 +155,41 @@ def save_entry(data, label):
         'definition': data['definition'],
         'url': data['url']
     }
-    entries = []
-    if os.path.exists(OUTPUT_FILE):
-        try:
-            with open(OUTPUT_FILE, 'r', encoding='UTF8') as f:
-                entries = json.load(f)
-        except Exception as e:
-            print(f"Warning: could not read existing JSON, starting fresh: {e}")
     entries.append(new_entry)
-    with open(OUTPUT_FILE, 'w', encoding='UTF8') as f:
-        json.dump(entries, f, indent=2, ensure_ascii=False)
+    payload = orjson.dumps(entries, option=orjson.OPT_INDENT_2)
+    with open(OUTPUT_FILE, 'wb') as f:
+        f.write(payload)
     print(f"Success! Saved: [{label}] {data['topic']}")
 
 
 # --- Main Execution ---
 if __name__ == "__main__":
-    used_topics = load_existing_topics()
+    entries = load_entries()
+    used_topics = load_existing_topics(entries)
 
     topic_found = False
-    attempts = 0
     max_attempts = 10
 
-    while not topic_found and attempts < max_attempts:
-        attempts += 1
-
-        selected_cat = random.choice(CATEGORY_DATA)
+    # Visit each category at most once, in random order
+    for selected_cat in random.sample(CATEGORY_DATA, k=min(max_attempts, len(CATEGORY_DATA))):
         cat_name = selected_cat['category']
         label = selected_cat['label']
         print(f"Searching in category: {cat_name}...")
 
-        random_title = get_random_page_from_category(cat_name)
-        if not random_title:
-            print(f"No pages found in {cat_name}, trying next category.")
-            continue
-
-        if random_title.lower().strip() in used_topics:
-            print(f"Topic '{random_title}' already exists. Finding another...")
-            time.sleep(1)
+        candidates = get_candidate_pages_from_category(cat_name, used_topics)
+        if not candidates:
+            print(f"No new pages found in {cat_name}, trying next category.")
             continue
 
-        wiki_data = get_wikipedia_definition(random_title)
-        if wiki_data:
-            save_entry(wiki_data, label)
+        # Redirects may resolve to a title that is already in the glossary
+        definitions = get_wikipedia_definitions(candidates)
+        available = [d for d in definitions.values() if d['topic'].lower().strip() not in used_topics]
+        if available:
+            save_entry(entries, available[0], label)
             topic_found = True
+            break
         else:
-            print(f"Could not fetch definition for {random_title}. Retrying...")
+            print(f"Could not fetch definitions from {cat_name}. Retrying...")
             time.sleep(1)
 
     if not topic_found:
@@ -9,10 +9,12 @@ Set NVD_API_KEY env var for higher rate limits.
 Schedule: Run via .github/workflows/nvd-collector.yml
 """
 
-import json
 import os
-import time
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from urllib.parse import urlparse
 
@@ -24,19 +26,27 @@ HEADERS = {'User-Agent': 'DevDigest-Bot/1.0'}
 if NVD_API_KEY:
     HEADERS['apiKey'] = NVD_API_KEY
 
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+))
+SESSION.headers.update(HEADERS)
+
 # Fetch CVEs published in the last N days per run
 LOOKBACK_DAYS = 3
 RESULTS_PER_PAGE = 20
 
 
 def load_existing():
-    if not os.path.exists(OUTPUT_FILE):
-        return [], set()
     try:
-        with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        existing_ids = {row.get('id') for row in data if row.get('id')}
+        with open(OUTPUT_FILE, 'rb') as f:
+            data = orjson.loads(f.read())
+        existing_ids = {row_id for row in data if (row_id := row.get('id'))}
         return data, existing_ids
+    except FileNotFoundError:
+        return [], set()
     except Exception as e:
         print(f'Warning: could not read {OUTPUT_FILE}: {e}')
         return [], set()
@@ -142,6 +152,11 @@ def cve_to_rows(item):
     return rows
 
 
+def _json(response):
+    """Parse a response body with orjson, skipping the text decode step."""
+    return orjson.loads(response.content)
+
+
 def fetch_recent_cves():
     end = datetime.now(timezone.utc)
     start = end - timedelta(days=LOOKBACK_DAYS)
@@ -150,23 +165,28 @@ def fetch_recent_cves():
         'pubEndDate':   end.strftime('%Y-%m-%dT%H:%M:%S.000'),
         'resultsPerPage': RESULTS_PER_PAGE,
     }
-    resp = requests.get(BASE_URL, headers=HEADERS, params=params, timeout=30)
+    resp = SESSION.get(BASE_URL, params=params, timeout=30)
     resp.raise_for_status()
-    return resp.json().get('vulnerabilities', [])
+    return _json(resp).get('vulnerabilities', [])
 
 
 def save(all_rows):
     os.makedirs(os.path.dirname(OUTPUT_FILE), exist_ok=True)
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(all_rows, f, indent=2, ensure_ascii=False)
+    payload = orjson.dumps(all_rows, option=orjson.OPT_INDENT_2)
+    with open(OUTPUT_FILE, 'wb') as f:
+        f.write(payload)
 
 
 def main():
-    existing_rows, existing_ids = load_existing()
+    # Parsing the local file and querying NVD are independent, so overlap them
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        existing_future = ex.submit(load_existing)
+        cves_future = ex.submit(fetch_recent_cves)
+        existing_rows, existing_ids = existing_future.result()
     print(f'Existing entries: {len(existing_ids)}')
 
     try:
-        items = fetch_recent_cves()
+        items = cves_future.result()
     except Exception as e:
         print(f'ERROR fetching NVD: {e}')
         return
@@ -179,7 +199,6 @@ def main():
         rows = cve_to_rows(item)
         new_rows.extend(rows)
         existing_ids.add(cve_id)
-        time.sleep(0.1)
 
     if not new_rows:
         print('No new CVEs found.')
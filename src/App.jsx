@@ -1,4 +1,4 @@
-import { useState, useEffect, lazy, Suspense } from "react";
+import { useState, useEffect, useRef, lazy, Suspense } from "react";
 import Nav from "./components/Nav";
 import Home from "./components/Home";
 
@@ -48,9 +48,13 @@ function parseCases(rows) {
         });
       }
     });
-  return Object.values(map).sort((a, b) =>
-    (b.year || "").localeCompare(a.year || ""),
-  );
+  // year is a fixed-width "YYYY" string (or empty), so plain string
+  // comparison orders it correctly without locale-aware collation
+  return Object.values(map).sort((a, b) => {
+    const ya = a.year || "";
+    const yb = b.year || "";
+    return ya < yb ? 1 : ya > yb ? -1 : 0;
+  });
 }
 
 export default function App() {
@@ -60,6 +64,7 @@ export default function App() {
   const [termsLoading, setTermsLoading] = useState(true);
   const [casesLoading, setCasesLoading] = useState(true);
   const [glossarySearch, setGlossarySearch] = useState("");
+  const casesRequested = useRef(false);
 
   // Fetch glossary immediately — needed for Home hero
   useEffect(() => {
@@ -70,10 +75,12 @@ export default function App() {
       .finally(() => setTermsLoading(false));
   }, []);
 
-  // Defer cases fetch until Cases section is first visited
+  // Defer cases fetch until Cases section is first visited, and only
+  // download + parse the feed once per page load
   useEffect(() => {
     if (section !== "cases" && section !== "home") return;
-    if (!casesLoading && cases.length > 0) return;
+    if (casesRequested.current) return;
+    casesRequested.current = true;
     fetch("./CaseStudies.json")
       .then((r) => (r.ok ? r.json() : []))
       .then((rows) => setCases(parseCases(rows)))
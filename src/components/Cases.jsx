@@ -1,4 +1,4 @@
-import { useState, useMemo } from "react";
+import { useState, useMemo, useEffect } from "react";
 
 const SEV_COLORS = {
   critical: "text-red-400 bg-red-400/10 border-red-400/30",
@@ -28,6 +28,9 @@ const SOURCE_LABELS = {
   github_advisory: "GitHub Advisory",
 };
 
+// Cards rendered per page — the feed holds thousands of entries
+const PAGE_SIZE = 50;
+
 function FeedCard({ c }) {
   const [open, setOpen] = useState(false);
 
@@ -213,21 +216,33 @@ export default function Cases({ cases, loading }) {
   const [search, setSearch] = useState("");
   const [typeFilter, setTypeFilter] = useState("");
   const [sevFilter, setSevFilter] = useState("");
+  const [visibleCount, setVisibleCount] = useState(PAGE_SIZE);
 
-  const filtered = useMemo(
+  // Lowercased search text per case, built once per data load
+  const searchText = useMemo(
     () =>
-      cases.filter(
-        (c) =>
-          (!search ||
-            c.title?.toLowerCase().includes(search.toLowerCase()) ||
-            c.summary?.toLowerCase().includes(search.toLowerCase()) ||
-            c.cve_id?.toLowerCase().includes(search.toLowerCase())) &&
-          (!typeFilter || c.type === typeFilter) &&
-          (!sevFilter || c.severity === sevFilter),
+      new Map(
+        cases.map((c) => [
+          c,
+          `${c.title || ""}\n${c.summary || ""}\n${c.cve_id || ""}`.toLowerCase(),
+        ]),
       ),
-    [cases, search, typeFilter, sevFilter],
+    [cases],
   );
 
+  const filtered = useMemo(() => {
+    const q = search.toLowerCase();
+    return cases.filter(
+      (c) =>
+        (!q || searchText.get(c).includes(q)) &&
+        (!typeFilter || c.type === typeFilter) &&
+        (!sevFilter || c.severity === sevFilter),
+    );
+  }, [cases, searchText, search, typeFilter, sevFilter]);
+
+  // Start from the first page whenever the filters change
+  useEffect(() => setVisibleCount(PAGE_SIZE), [search, typeFilter, sevFilter]);
+
   // Stats
   const stats = useMemo(
     () => ({
@@ -383,15 +398,25 @@ export default function Cases({ cases, loading }) {
         </div>
       ) : (
         <div className="space-y-4">
-          {filtered.map((c, i) => (
+          {filtered.slice(0, visibleCount).map((c, i) => (
             <div 
               key={c.id} 
               className="animate-slide-up" 
-              style={{ animationDelay: `${i * 70}ms`, animationFillMode: 'both' }}
+              style={{ animationDelay: `${(i % PAGE_SIZE) * 70}ms`, animationFillMode: 'both' }}
             >
               <FeedCard c={c} />
             </div>
           ))}
+          {visibleCount < filtered.length && (
+            <div className="text-center pt-4">
+              <button
+                onClick={() => setVisibleCount((n) => n + PAGE_SIZE)}
+                className="inline-flex items-center gap-2 text-text-primary border border-border hover:border-border-bright text-sm font-bold px-6 py-3 rounded-2xl transition-all bg-white/5 backdrop-blur-sm hover:bg-white/10"
+              >
+                Show more ({filtered.length - visibleCount} remaining)
+              </button>
+            </div>
+          )}
         </div>
       )}
     </div>
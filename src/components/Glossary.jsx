@@ -1,5 +1,16 @@
 import { useState, useMemo } from 'react'
 
+// date_added is ISO YYYY-MM-DD, so string order is already date order
+const compareDates = (a = '', b = '') => (a < b ? -1 : a > b ? 1 : 0)
+const collator = new Intl.Collator()
+
+const SORTERS = {
+  'date-desc': (a, b) => compareDates(b.date_added, a.date_added),
+  'date-asc': (a, b) => compareDates(a.date_added, b.date_added),
+  'alpha-asc': (a, b) => collator.compare(a.topic || '', b.topic || ''),
+  'alpha-desc': (a, b) => collator.compare(b.topic || '', a.topic || ''),
+}
+
 export default function Glossary({ terms, initialSearch = '', onGoTerm }) {
   const [search, setSearch] = useState(initialSearch)
   const [category, setCategory] = useState('')
@@ -9,20 +20,20 @@ export default function Glossary({ terms, initialSearch = '', onGoTerm }) {
   const categories = useMemo(() =>
     [...new Set(terms.map(t => t.category).filter(Boolean))].sort(), [terms])
 
+  // Sort only when the sort order (or data) changes — typing just re-filters
+  const sorted = useMemo(() => [...terms].sort(SORTERS[sort]), [terms, sort])
+
+  // Lowercased search text per term, built once per data load
+  const searchText = useMemo(() =>
+    new Map(terms.map(t => [t, `${t.topic || ''}\n${t.definition || ''}`.toLowerCase()])), [terms])
+
   const filtered = useMemo(() => {
-    let f = terms.filter(t =>
-      (!search || t.topic?.toLowerCase().includes(search.toLowerCase()) ||
-        t.definition?.toLowerCase().includes(search.toLowerCase())) &&
+    const q = search.toLowerCase()
+    return sorted.filter(t =>
+      (!q || searchText.get(t).includes(q)) &&
       (!category || t.category === category)
     )
-    f.sort((a, b) => {
-      if (sort === 'alpha-asc') return (a.topic || '').localeCompare(b.topic || '')
-      if (sort === 'alpha-desc') return (b.topic || '').localeCompare(a.topic || '')
-      if (sort === 'date-asc') return new Date(a.date_added) - new Date(b.date_added)
-      return new Date(b.date_added) - new Date(a.date_added)
-    })
-    return f
-  }, [terms, search, category, sort])
+  }, [sorted, searchText, search, category])
 
   const related = useMemo(() =>
     selected
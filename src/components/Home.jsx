@@ -1,4 +1,10 @@
+import { useMemo } from 'react'
+
 export default function Home({ terms, cases, loading, onGoTerm, setSection }) {
+  // Depends on terms only, so the cases feed arriving doesn't rescan them
+  const categories = useMemo(() =>
+    new Set(terms.map(t => t.category).filter(Boolean)).size, [terms])
+
   if (loading) return (
     <div className="animate-pulse space-y-6">
       <div className="rounded-2xl border border-white/5 bg-white/5 h-56 w-full" />
@@ -14,7 +20,6 @@ export default function Home({ terms, cases, loading, onGoTerm, setSection }) {
   const today = new Date().toISOString().slice(0, 10).replace(/-/g, '')
   const daily = terms.length ? terms[parseInt(today, 10) % terms.length] : null
   const recent = terms.slice(0, 6)
-  const categories = new Set(terms.map(t => t.category).filter(Boolean)).size
 
   // Format date from YYYY-MM-DD to "Apr 12, 2026"
   const formatDate = (d) => {
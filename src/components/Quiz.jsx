@@ -1,6 +1,14 @@
 import { useState } from 'react'
 
-function shuffle(arr) { return [...arr].sort(() => Math.random() - 0.5) }
+// Fisher–Yates: one O(n) pass, unbiased (a random sort comparator is neither)
+function shuffle(arr) {
+  const out = [...arr]
+  for (let i = out.length - 1; i > 0; i--) {
+    const j = Math.floor(Math.random() * (i + 1));
+    [out[i], out[j]] = [out[j], out[i]]
+  }
+  return out
+}
 
 export default function Quiz({ terms }) {
   const [deck, setDeck] = useState(() => shuffle(terms))